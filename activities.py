@@ -1,11 +1,85 @@
 import asyncio
 import requests
 from temporalio import activity
-from typing import List, Dict
+from typing import List, Dict, Tuple
+
+from models import SearchResult, SummarizeInput
+from ranking import select_results
+
+# Bound what web_search puts into workflow history
+MAX_SEARCH_RESULTS = 5
+MAX_SEARCH_RESULT_CHARS = 4000
+
+# Longest snippet shown in a summary before it gets clipped
+MAX_SNIPPET_CHARS = 500
+
+# HTTP timeout when not running under a heartbeat timeout
+DEFAULT_HTTP_TIMEOUT = 10
+
+# The request may use this share of the heartbeat timeout, leaving the rest
+# for the parsing heartbeat or the error fallback
+HTTP_TIMEOUT_HEARTBEAT_FRACTION = 0.5
+# Share of the HTTP timeout spent connecting; reading gets the remainder
+HTTP_CONNECT_FRACTION = 0.3
+
+
+def _http_timeout() -> Tuple[float, float]:
+    """(connect, read) timeouts that fit inside the heartbeat window."""
+    total = DEFAULT_HTTP_TIMEOUT
+    if activity.in_activity():
+        heartbeat_timeout = activity.info().heartbeat_timeout
+        if heartbeat_timeout:
+            total = (heartbeat_timeout.total_seconds()
+                     * HTTP_TIMEOUT_HEARTBEAT_FRACTION)
+    connect = total * HTTP_CONNECT_FRACTION
+    return connect, total - connect
+
+
+def parse_search_response(data: Dict, query: str) -> List[SearchResult]:
+    """Turn a DuckDuckGo instant answer payload into structured results."""
+    results = []
+
+    # Add abstract if available
+    if data.get("Abstract"):
+        results.append(SearchResult(
+            title=data.get("Heading", "Summary"),
+            url=data.get("AbstractURL", ""),
+            snippet=data.get("Abstract", ""),
+            source="DuckDuckGo Abstract",
+        ))
+
+    # Add related topics, flattening grouped topics ("See also", etc.)
+    for topic in data.get("RelatedTopics", []):
+        if not isinstance(topic, dict):
+            continue
+        for entry in topic.get("Topics", [topic]):
+            if isinstance(entry, dict) and entry.get("Text"):
+                results.append(SearchResult(
+                    title=entry.get("Text", "")[:100] + "...",
+                    url=entry.get("FirstURL", ""),
+                    snippet=entry.get("Text", ""),
+                    source="DuckDuckGo Related",
+                ))
+
+    # Keep the best few distinct results within the payload budget
+    results = select_results(results, query, MAX_SEARCH_RESULTS,
+                             MAX_SEARCH_RESULT_CHARS)
+
+    # If no results from DuckDuckGo, provide a fallback
+    if not results:
+        results.append(SearchResult(
+            title=f"Search results for: {query}",
+            url=f"https://duckduckgo.com/?q={query.replace(' ', '+')}",
+            snippet=(f"No instant answers found for '{query}'. "
+                     f"Click to see full search results."),
+            source="DuckDuckGo Search",
+        ))
+
+    return results
 
 
 @activity.defn
-async def web_search(query: str) -> List[Dict[str, str]]:
+async def web_search(query: str) -> List[SearchResult]:
     """Search the web for a query and return structured results."""
     print(f"🔍 Searching for: {query}")
 
@@ -21,42 +95,18 @@ async def web_search(query: str) -> List[Dict[str, str]]:
             "skip_disambig": "1"
         }
 
-        response = requests.get(url, params=params, timeout=10)
+        if activity.in_activity():
+            activity.heartbeat("requesting")
+        # requests blocks, so keep it off the event loop
+        response = await asyncio.to_thread(
+            requests.get, url, params=params, timeout=_http_timeout())
         response.raise_for_status()
 
         data = response.json()
+        if activity.in_activity():
+            activity.heartbeat("parsing")
 
-        # Extract results
-        results = []
-
-        # Add abstract if available
-        if data.get("Abstract"):
-            results.append({
-                "title": data.get("Heading", "Summary"),
-                "url": data.get("AbstractURL", ""),
-                "snippet": data.get("Abstract", ""),
-                "source": "DuckDuckGo Abstract"
-            })
-
-        # Add related topics
-        for topic in data.get("RelatedTopics", [])[:3]:  # Limit to 3 results
-            if isinstance(topic, dict) and topic.get("Text"):
-                results.append({
-                    "title": topic.get("Text", "")[:100] + "...",
-                    "url": topic.get("FirstURL", ""),
-                    "snippet": topic.get("Text", ""),
-                    "source": "DuckDuckGo Related"
-                })
-
-        # If no results from DuckDuckGo, provide a fallback
-        if not results:
-            results.append({
-                "title": f"Search results for: {query}",
-                "url": f"https://duckduckgo.com/?q={query.replace(' ', '+')}",
-                "snippet": (f"No instant answers found for '{query}'. "
-                           f"Click to see full search results."),
-                "source": "DuckDuckGo Search"
-            })
+        results = parse_search_response(data, query)
 
         print(f"✅ Found {len(results)} search results")
         return results
@@ -64,45 +114,67 @@ async def web_search(query: str) -> List[Dict[str, str]]:
     except Exception as e:
         print(f"❌ Search failed: {e}")
         # Return a fallback result
-        return [{
-            "title": f"Search Error for: {query}",
-            "url": f"https://duckduckgo.com/?q={query.replace(' ', '+')}",
-            "snippet": (f"Search encountered an error: {str(e)}. "
-                        f"Please try the direct search link."),
-            "source": "Error Fallback"
-        }]
+        return [SearchResult(
+            title=f"Search Error for: {query}",
+            url=f"https://duckduckgo.com/?q={query.replace(' ', '+')}",
+            snippet=(f"Search encountered an error: {str(e)}. "
+                     f"Please try the direct search link."),
+            source="Error Fallback",
+        )]
 
 
 @activity.defn
-async def summarize_results(args: tuple) -> str:
+async def summarize_results(input: SummarizeInput) -> str:
     """Summarize the search results for the user."""
-    query, search_results = args
+    query, search_results = input.query, input.results
     print(f"📝 Summarizing {len(search_results)} results for: {query}")
 
+    if input.max_chars < 1:
+        raise ValueError(f"max_chars must be positive, got {input.max_chars}")
+
     if not search_results:
         return (f"❌ No results found for '{query}'. "
                 f"Please try a different search term.")
 
-    # Create a structured summary
-    summary_parts = [
-        f"🔍 **Search Results for: {query}**",
-        f"Found {len(search_results)} relevant results:\n"
-    ]
-
-    for i, result in enumerate(search_results, 1):
-        summary_parts.append(f"**{i}. {result['title']}**")
-        summary_parts.append(f"   {result['snippet']}")
-        if result['url']:
-            summary_parts.append(f"   🔗 {result['url']}")
-        summary_parts.append("")  # Empty line for readability
-
-    # Add a conclusion
-    summary_parts.append("---")
-    summary_parts.append(
-        "💡 **Summary**: These results provide comprehensive information "
-        "about your search topic. Click the links to explore further.")
+    # Rank and de-duplicate, then format in one pass within the budget.
+    # web_search already ranks its few results, so only larger inputs are
+    # re-ranked here.
+    selected = select_results(
+        search_results, query, input.max_results,
+        rank=len(search_results) > input.max_results)
+    header = f"🔍 **Search Results for: {query}**"
+    footer = ("---\n"
+              "💡 **Summary**: These results provide comprehensive information "
+              "about your search topic. Click the links to explore further.")
+    # Room for the count line and the omitted-results note
+    budget = input.max_chars - len(header) - len(footer) - 100
+
+    blocks = []
+    for result in selected:
+        snippet = result.snippet
+        if len(snippet) > MAX_SNIPPET_CHARS:
+            snippet = snippet[:MAX_SNIPPET_CHARS - 1] + "…"
+        block = f"**{len(blocks) + 1}. {result.title}**\n   {snippet}\n"
+        if result.url:
+            block += f"   🔗 {result.url}\n"
+        # Each block is followed by a newline when joined
+        if len(block) + 1 > budget:
+            break
+        blocks.append(block)
+        budget -= len(block) + 1
+
+    summary_parts = [header, f"Found {len(blocks)} relevant results:\n"]
+    summary_parts.extend(blocks)
+    omitted = len(search_results) - len(blocks)
+    if omitted:
+        summary_parts.append(f"➕ {omitted} duplicate or lower-ranked "
+                             f"results not shown.\n")
+    summary_parts.append(footer)
 
     summary = "\n".join(summary_parts)
+    # A budget smaller than the header and footer still has to be honoured
+    if len(summary) > input.max_chars:
+        summary = summary[:input.max_chars - 1] + "…"
     print(f"✅ Summary completed ({len(summary)} characters)")
     return summary
 
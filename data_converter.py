@@ -0,0 +1,55 @@
+import dataclasses
+from typing import Any
+
+from temporalio.converter import (AdvancedJSONEncoder,
+                                  CompositePayloadConverter, DataConverter,
+                                  DefaultPayloadConverter,
+                                  JSONPlainPayloadConverter,
+                                  JSONTypeConverter)
+
+from models import SearchResult, SummarizeInput
+
+
+class CompactJSONEncoder(AdvancedJSONEncoder):
+    """Encode search models as positional lists instead of keyed dicts."""
+
+    def default(self, o: Any) -> Any:
+        if isinstance(o, (SearchResult, SummarizeInput)):
+            return o.to_row()
+        return super().default(o)
+
+
+class SearchModelTypeConverter(JSONTypeConverter):
+    """Decode search models from positional rows or legacy dicts."""
+
+    def to_typed_value(self, hint: type, value: Any) -> Any:
+        if hint is SearchResult:
+            return SearchResult.from_value(value)
+        if hint is SummarizeInput:
+            return SummarizeInput.from_value(value)
+        return JSONTypeConverter.Unhandled
+
+
+class CompactPayloadConverter(CompositePayloadConverter):
+    """Default payload converter with compact search model encoding.
+
+    The encoding name stays ``json/plain``, so payloads already in workflow
+    history (lists of result dicts, ``(query, results)`` tuples) still decode.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(
+            *(converter for converter
+              in DefaultPayloadConverter.default_encoding_payload_converters
+              if not isinstance(converter, JSONPlainPayloadConverter)),
+            JSONPlainPayloadConverter(
+                encoder=CompactJSONEncoder,
+                custom_type_converters=[SearchModelTypeConverter()],
+            ),
+        )
+
+
+compact_data_converter = dataclasses.replace(
+    DataConverter.default,
+    payload_converter_class=CompactPayloadConverter,
+)
@@ -2,10 +2,13 @@ import asyncio
 import time
 from temporalio.client import Client
 
+from data_converter import compact_data_converter
+
 
 async def main():
     # Connect to the Temporal server
-    client = await Client.connect("localhost:7233")
+    client = await Client.connect(
+        "localhost:7233", data_converter=compact_data_converter)
 
     # Start the workflow (calls HelloAgentWorkflow.run with "Neo")
     try:
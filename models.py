@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+from typing import Any, List
+
+# Defaults for how many results a summary shows and how long it may get
+DEFAULT_MAX_RESULTS = 5
+DEFAULT_MAX_SUMMARY_CHARS = 4000
+
+
+@dataclass(slots=True)
+class SearchResult:
+    """A single web search hit."""
+    title: str
+    url: str
+    snippet: str
+    source: str
+
+    def to_row(self) -> list:
+        """Positional form used on the wire: [title, url, snippet, source]."""
+        return [self.title, self.url, self.snippet, self.source]
+
+    @classmethod
+    def from_value(cls, value: Any) -> "SearchResult":
+        """Build from a positional row, or a legacy dict payload."""
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, dict):
+            # Results recorded before SearchResult existed were dicts
+            return cls(value.get("title", ""), value.get("url", ""),
+                       value.get("snippet", ""), value.get("source", ""))
+        return cls(*value)
+
+
+@dataclass(slots=True)
+class SummarizeInput:
+    """Arguments for the summarize_results activity."""
+    query: str
+    results: List[SearchResult]
+    max_results: int = DEFAULT_MAX_RESULTS
+    max_chars: int = DEFAULT_MAX_SUMMARY_CHARS
+
+    def to_row(self) -> list:
+        """Positional form used on the wire:
+        [query, results, max_results, max_chars]."""
+        return [self.query, self.results, self.max_results, self.max_chars]
+
+    @classmethod
+    def from_value(cls, value: Any) -> "SummarizeInput":
+        """Build from a positional row, a dict, or the legacy
+        ``(query, search_results)`` tuple (encoded as a JSON list)."""
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, dict):
+            limits = {key: value[key] for key in ("max_results", "max_chars")
+                      if key in value}
+            return cls(value["query"],
+                       [SearchResult.from_value(r) for r in value["results"]],
+                       **limits)
+        query, results, *limits = value
+        return cls(query, [SearchResult.from_value(r) for r in results],
+                   *limits)
@@ -0,0 +1,155 @@
+import dataclasses
+import json
+import statistics
+import sys
+from collections import defaultdict
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
+
+from temporalio.common import RetryPolicy
+
+
+@dataclasses.dataclass(frozen=True)
+class LatencyProfile:
+    """Observed activity latency percentiles in milliseconds."""
+    p50_ms: float
+    p99_ms: float
+
+
+# Workflows must stay deterministic, so percentiles are checked in rather
+# than read at runtime. These are seed estimates, not measurements, until
+# they are regenerated from a profiled worker (worker.py --profile) with:
+# python policies.py profiles/timings.jsonl
+OBSERVED_LATENCY_MS: Dict[str, LatencyProfile] = {
+    "web_search": LatencyProfile(p50_ms=450, p99_ms=3000),
+    "summarize_results": LatencyProfile(p50_ms=1, p99_ms=25),
+    "simulate_llm_response": LatencyProfile(p50_ms=1002, p99_ms=1010),
+    "flaky_activity": LatencyProfile(p50_ms=501, p99_ms=510),
+}
+
+# start-to-close is this many p99s, clamped to the bounds below
+TIMEOUT_P99_MULTIPLIER = 3
+HEARTBEAT_P99_MULTIPLIER = 2
+MIN_TIMEOUT = timedelta(seconds=1)
+MAX_TIMEOUT = timedelta(seconds=60)
+
+# Activities that call activity.heartbeat() and so get a heartbeat timeout
+HEARTBEATING_ACTIVITIES = frozenset({"web_search"})
+
+# Programming errors fail the same way on every attempt
+DETERMINISTIC_ERROR_TYPES = ["TypeError", "AttributeError", "KeyError"]
+
+NON_RETRYABLE_ERROR_TYPES: Dict[str, List[str]] = {
+    "summarize_results": DETERMINISTIC_ERROR_TYPES + ["ValueError"],
+    # The simulated LLM failure is raised on every call
+    "flaky_activity": DETERMINISTIC_ERROR_TYPES + ["RuntimeError"],
+}
+
+RETRY_POLICIES: Dict[str, RetryPolicy] = {
+    "web_search": RetryPolicy(initial_interval=timedelta(seconds=2),
+                              maximum_attempts=3),
+    "summarize_results": RetryPolicy(initial_interval=timedelta(seconds=1),
+                                     maximum_attempts=2),
+    "simulate_llm_response": RetryPolicy(initial_interval=timedelta(seconds=1),
+                                         maximum_attempts=3),
+    "flaky_activity": RetryPolicy(initial_interval=timedelta(seconds=1),
+                                  maximum_attempts=3),
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class ActivityPolicy:
+    """Timeouts and retry policy used when scheduling an activity."""
+    start_to_close_timeout: timedelta
+    schedule_to_close_timeout: timedelta
+    retry_policy: RetryPolicy
+    heartbeat_timeout: Optional[timedelta] = None
+
+    def options(self) -> Dict[str, Any]:
+        """Keyword arguments for workflow.execute_activity."""
+        options = {
+            "start_to_close_timeout": self.start_to_close_timeout,
+            "schedule_to_close_timeout": self.schedule_to_close_timeout,
+            "retry_policy": self.retry_policy,
+        }
+        if self.heartbeat_timeout:
+            options["heartbeat_timeout"] = self.heartbeat_timeout
+        return options
+
+
+def _clamp(value: timedelta, low: timedelta, high: timedelta) -> timedelta:
+    return max(low, min(value, high))
+
+
+def build_policy(name: str, latency: LatencyProfile,
+                 retry_policy: RetryPolicy) -> ActivityPolicy:
+    """Derive an activity's timeouts from its latency percentiles."""
+    p99 = timedelta(milliseconds=latency.p99_ms)
+    start_to_close = _clamp(p99 * TIMEOUT_P99_MULTIPLIER,
+                            MIN_TIMEOUT, MAX_TIMEOUT)
+
+    heartbeat = None
+    if name in HEARTBEATING_ACTIVITIES:
+        heartbeat = _clamp(p99 * HEARTBEAT_P99_MULTIPLIER,
+                           MIN_TIMEOUT, start_to_close)
+
+    retry_policy = dataclasses.replace(
+        retry_policy,
+        non_retryable_error_types=NON_RETRYABLE_ERROR_TYPES.get(
+            name, DETERMINISTIC_ERROR_TYPES),
+    )
+
+    # Enough time for every attempt plus the backoff between them
+    attempts = max(retry_policy.maximum_attempts, 1)
+    backoff = sum(
+        (retry_policy.initial_interval
+         * retry_policy.backoff_coefficient ** attempt
+         for attempt in range(attempts - 1)),
+        timedelta())
+    schedule_to_close = start_to_close * attempts + backoff
+
+    return ActivityPolicy(
+        start_to_close_timeout=start_to_close,
+        schedule_to_close_timeout=schedule_to_close,
+        retry_policy=retry_policy,
+        heartbeat_timeout=heartbeat,
+    )
+
+
+ACTIVITY_POLICIES: Dict[str, ActivityPolicy] = {
+    name: build_policy(name, latency, RETRY_POLICIES[name])
+    for name, latency in OBSERVED_LATENCY_MS.items()
+}
+
+
+def activity_options(name: str) -> Dict[str, Any]:
+    """Timeouts and retry policy for scheduling activity `name`."""
+    return ACTIVITY_POLICIES[name].options()
+
+
+def latency_from_timings(path: str) -> Dict[str, LatencyProfile]:
+    """Compute latency percentiles from a profiler timings.jsonl file."""
+    samples = defaultdict(list)
+    with open(path) as f:
+        for line in f:
+            entry = json.loads(line)
+            if entry.get("kind") == "activity":
+                samples[entry["name"]].append(entry["wall_ms"])
+
+    profiles = {}
+    for name, wall_ms in samples.items():
+        if len(wall_ms) < 2:
+            profiles[name] = LatencyProfile(wall_ms[0], wall_ms[0])
+            continue
+        cuts = statistics.quantiles(wall_ms, n=100, method="inclusive")
+        profiles[name] = LatencyProfile(round(cuts[49], 1),
+                                        round(cuts[98], 1))
+    return profiles
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit("usage: python policies.py <timings.jsonl>")
+    for name, latency in sorted(latency_from_timings(sys.argv[1]).items()):
+        print(f'    "{name}": LatencyProfile(p50_ms={latency.p50_ms}, '
+              f'p99_ms={latency.p99_ms}),')
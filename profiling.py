@@ -0,0 +1,261 @@
+import asyncio
+import concurrent.futures
+import cProfile
+import json
+import queue
+import random
+import signal
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, FrozenSet, Optional
+
+from temporalio import activity
+from temporalio.worker import (ActivityInboundInterceptor,
+                               ExecuteActivityInput, Interceptor)
+
+
+@dataclass
+class ProfilingConfig:
+    """Settings for on-demand worker profiling."""
+    output_dir: Path = Path("profiles")
+    # Fraction of sampled activity calls that get a cProfile/tracemalloc dump
+    sample_rate: float = 0.1
+    sampled_activities: FrozenSet[str] = field(
+        default_factory=lambda: frozenset({"web_search",
+                                           "summarize_results"}))
+    capture_memory: bool = False
+    # Event loop lag above this is reported as a stall
+    stall_threshold_ms: float = 100.0
+
+
+class WorkerProfiler(Interceptor):
+    """Worker interceptor recording wall vs CPU time per task.
+
+    Activities are timed through the interceptor chain. Workflow tasks run
+    in the worker's thread pool, so they are timed by the executor returned
+    from :meth:`workflow_task_executor`. Everything is written as JSON lines
+    to ``timings.jsonl`` in the output directory, next to any cProfile
+    (``.prof``) and tracemalloc (``.tracemalloc``) dumps.
+
+    Profiling can be toggled at runtime with :meth:`install_signal_handler`
+    (SIGUSR1 by default); while disabled the interceptor only checks a flag.
+
+    All file writes happen on a background writer thread, so recording never
+    blocks the event loop or the workflow thread being timed.
+    """
+
+    def __init__(self, config: Optional[ProfilingConfig] = None,
+                 enabled: bool = False) -> None:
+        self.config = config or ProfilingConfig()
+        self.enabled = enabled
+        self._capturing = False
+        self._monitor_task: Optional[asyncio.Task] = None
+        self._writes: "queue.Queue[Optional[Callable]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+
+    def intercept_activity(
+        self, next: ActivityInboundInterceptor
+    ) -> ActivityInboundInterceptor:
+        return _ProfilingActivityInbound(next, self)
+
+    def workflow_task_executor(
+        self, max_workers: int = 500
+    ) -> concurrent.futures.ThreadPoolExecutor:
+        """Thread pool for the worker that times each workflow activation."""
+        return _ProfilingExecutor(self, max_workers=max_workers,
+                                  thread_name_prefix="temporal_workflow_")
+
+    def toggle(self) -> None:
+        self.enabled = not self.enabled
+        state = "enabled" if self.enabled else "disabled"
+        print(f"🩺 Worker profiling {state} "
+              f"(output: {self.config.output_dir})")
+
+    def install_signal_handler(self, sig: int = signal.SIGUSR1) -> None:
+        """Toggle profiling whenever the process receives `sig`."""
+        asyncio.get_running_loop().add_signal_handler(sig, self.toggle)
+
+    def start(self) -> None:
+        """Start watching the running event loop for stalls."""
+        self._monitor_task = asyncio.create_task(self._watch_event_loop())
+
+    async def stop(self) -> None:
+        if self._monitor_task:
+            self._monitor_task.cancel()
+            try:
+                await self._monitor_task
+            except asyncio.CancelledError:
+                pass
+            self._monitor_task = None
+        await asyncio.to_thread(self.close)
+
+    def record(self, kind: str, name: str, **fields: Any) -> None:
+        """Queue a timing record for timings.jsonl."""
+        entry = {"ts": time.time(), "kind": kind, "name": name, **fields}
+        self.submit_write(
+            lambda timings: timings.write(json.dumps(entry) + "\n"))
+
+    def submit_write(self, write: Callable[[Any], None]) -> None:
+        """Run `write(timings_file)` on the writer thread."""
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_loop, name="profiler-writer",
+                    daemon=True)
+                self._writer.start()
+        self._writes.put(write)
+
+    def flush(self) -> None:
+        """Block until every queued write has reached disk."""
+        if self._writer is not None:
+            self._writes.join()
+
+    def close(self) -> None:
+        """Flush pending writes and stop the writer thread."""
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            self._writes.put(None)
+            writer.join()
+
+    def _write_loop(self) -> None:
+        timings = None
+        try:
+            self.config.output_dir.mkdir(parents=True, exist_ok=True)
+            timings = open(self.config.output_dir / "timings.jsonl", "a")
+        except OSError as e:
+            # Keep draining the queue so flush() returns and nothing piles up
+            print(f"⚠️  Profiler output disabled, cannot open "
+                  f"{self.config.output_dir}: {e}")
+        try:
+            while True:
+                write = self._writes.get()
+                try:
+                    if write is None:
+                        return
+                    if timings is None:
+                        continue
+                    write(timings)
+                    if self._writes.empty():
+                        timings.flush()
+                except Exception as e:
+                    # One failed dump must not stop later records
+                    print(f"⚠️  Profiler write failed: {e}")
+                finally:
+                    self._writes.task_done()
+        finally:
+            if timings is not None:
+                timings.close()
+
+    def should_capture(self, activity_type: str) -> bool:
+        # cProfile and tracemalloc are process-wide, so one capture at a time
+        return (not self._capturing
+                and activity_type in self.config.sampled_activities
+                and random.random() < self.config.sample_rate)
+
+    async def _watch_event_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        threshold = self.config.stall_threshold_ms / 1000
+        interval = min(0.05, threshold / 2)
+        while True:
+            expected = loop.time() + interval
+            await asyncio.sleep(interval)
+            lag = loop.time() - expected
+            if self.enabled and lag >= threshold:
+                print(f"⚠️  Event loop stalled for {lag * 1000:.0f}ms")
+                self.record("loop_stall", "event_loop",
+                            lag_ms=round(lag * 1000, 2))
+
+
+class _ProfilingActivityInbound(ActivityInboundInterceptor):
+    def __init__(self, next: ActivityInboundInterceptor,
+                 profiler: WorkerProfiler) -> None:
+        super().__init__(next)
+        self._profiler = profiler
+
+    async def execute_activity(self, input: ExecuteActivityInput) -> Any:
+        profiler = self._profiler
+        if not profiler.enabled:
+            return await self.next.execute_activity(input)
+
+        info = activity.info()
+        capture = profiler.should_capture(info.activity_type)
+        profile = None
+        started_tracemalloc = False
+        if capture:
+            profiler._capturing = True
+            profile = cProfile.Profile()
+            if (profiler.config.capture_memory
+                    and not tracemalloc.is_tracing()):
+                tracemalloc.start()
+                started_tracemalloc = True
+            profile.enable()
+
+        # This is CPU time of the event loop thread, so it includes anything
+        # else the loop ran while the activity was awaiting
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            return await self.next.execute_activity(input)
+        finally:
+            cpu = time.thread_time() - cpu_start
+            wall = time.perf_counter() - wall_start
+            if profile:
+                profile.disable()
+                self._dump(info, profile, started_tracemalloc)
+                profiler._capturing = False
+            profiler.record("activity", info.activity_type,
+                            activity_id=info.activity_id,
+                            attempt=info.attempt,
+                            wall_ms=round(wall * 1000, 3),
+                            loop_cpu_ms=round(cpu * 1000, 3),
+                            profiled=capture)
+
+    def _dump(self, info: activity.Info, profile: cProfile.Profile,
+              started_tracemalloc: bool) -> None:
+        output_dir = self._profiler.config.output_dir
+        stem = (f"{info.activity_type}-{info.activity_id}-"
+                f"{int(time.time() * 1000)}")
+        snapshot = None
+        if started_tracemalloc:
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+
+        # Serializing the dumps is slow, so leave it to the writer thread
+        def write_dumps(timings: Any) -> None:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            profile.dump_stats(output_dir / f"{stem}.prof")
+            if snapshot is not None:
+                snapshot.dump(str(output_dir / f"{stem}.tracemalloc"))
+
+        self._profiler.submit_write(write_dumps)
+
+
+class _ProfilingExecutor(concurrent.futures.ThreadPoolExecutor):
+    def __init__(self, profiler: WorkerProfiler, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._profiler = profiler
+
+    def submit(self, fn: Callable, /, *args: Any, **kwargs: Any):
+        if not self._profiler.enabled:
+            return super().submit(fn, *args, **kwargs)
+        return super().submit(self._timed, fn, *args, **kwargs)
+
+    def _timed(self, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            cpu = time.thread_time() - cpu_start
+            wall = time.perf_counter() - wall_start
+            # The worker submits WorkflowActivation protos for each task
+            run_id = getattr(args[0], "run_id", "") if args else ""
+            self._profiler.record("workflow_task", "workflow_activation",
+                                  run_id=run_id,
+                                  wall_ms=round(wall * 1000, 3),
+                                  cpu_ms=round(cpu * 1000, 3))
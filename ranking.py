@@ -0,0 +1,167 @@
+import heapq
+import re
+from typing import FrozenSet, Iterator, List, Optional
+from urllib.parse import parse_qsl, urlencode
+
+from models import SearchResult
+
+# Higher weight ranks first; unknown sources (fallbacks) rank last
+SOURCE_WEIGHTS = {
+    "DuckDuckGo Abstract": 2.0,
+    "DuckDuckGo Related": 1.0,
+}
+
+# Snippets sharing at least this fraction of words count as duplicates
+NEAR_DUPLICATE_THRESHOLD = 0.9
+
+# select_results only ranks this many candidates per wanted result up front;
+# the rest are sorted only if duplicates or the budget exhaust the pool
+CANDIDATE_POOL_FACTOR = 4
+
+_TRACKING_PARAM_PREFIXES = ("utm_",)
+_WORD_RE = re.compile(r"\w+")
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form of a URL for duplicate detection.
+
+    Scheme, ``www.``, fragments, trailing slashes and tracking parameters
+    are dropped and the remaining query parameters sorted.
+    """
+    if not url:
+        return ""
+    # Plain string slicing; urlsplit is several times slower on the hot path
+    url = url.strip()
+    scheme_end = url.find("://")
+    if scheme_end != -1:
+        url = url[scheme_end + 3:]
+    url = url.partition("#")[0]
+    base, _, query = url.partition("?")
+    host, _, path = base.partition("/")
+    host = host.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    key = f"{host}/{path}".rstrip("/")
+    if query:
+        query = urlencode(sorted(
+            (name, value) for name, value in parse_qsl(query)
+            if not name.startswith(_TRACKING_PARAM_PREFIXES)))
+        if query:
+            key = f"{key}?{query}"
+    return key
+
+
+def _words(text: str) -> FrozenSet[str]:
+    return frozenset(_WORD_RE.findall(text.lower()))
+
+
+def _similarity(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a or not b:
+        return 0.0
+    # Jaccard can't exceed the size ratio, so skip the set math when it's low
+    smaller, larger = sorted((len(a), len(b)))
+    if smaller / larger < NEAR_DUPLICATE_THRESHOLD:
+        return smaller / larger
+    return len(a & b) / len(a | b)
+
+
+def result_size(result: SearchResult) -> int:
+    """Characters a result contributes to payloads and summaries."""
+    return (len(result.title) + len(result.url) + len(result.snippet)
+            + len(result.source))
+
+
+def _scores(results: List[SearchResult], query: str) -> List[float]:
+    terms = tuple(_words(query))
+    weight = SOURCE_WEIGHTS.get
+    if not terms:
+        return [weight(result.source, 0.0) for result in results]
+
+    scores = []
+    for result in results:
+        # Substring checks are much cheaper than tokenizing every result
+        text = f"{result.title} {result.snippet}".lower()
+        matched = 0
+        for term in terms:
+            if term in text:
+                matched += 1
+        scores.append(weight(result.source, 0.0) + matched / len(terms))
+    return scores
+
+
+def rank_results(results: List[SearchResult],
+                 query: str) -> List[SearchResult]:
+    """Order results by source weight and query term coverage.
+
+    The sort is stable, so equally scored results keep their input order.
+    """
+    scores = _scores(results, query)
+    order = sorted(range(len(results)), key=scores.__getitem__, reverse=True)
+    return [results[i] for i in order]
+
+
+def _ranked_candidates(results: List[SearchResult], query: str,
+                       pool: int) -> Iterator[SearchResult]:
+    """Yield results best first, only fully sorting them if `pool` runs out.
+
+    heapq.nlargest is equivalent to a stable sort truncated to `pool`, so the
+    order matches :func:`rank_results`.
+    """
+    scores = _scores(results, query)
+    key = scores.__getitem__
+    indexes = range(len(results))
+    if pool < len(results):
+        top = heapq.nlargest(pool, indexes, key=key)
+        yield from (results[i] for i in top)
+        indexes = sorted(indexes, key=key, reverse=True)[pool:]
+    else:
+        indexes = sorted(indexes, key=key, reverse=True)
+    for i in indexes:
+        yield results[i]
+
+
+def select_results(results: List[SearchResult], query: str, max_results: int,
+                   max_chars: Optional[int] = None,
+                   rank: bool = True) -> List[SearchResult]:
+    """Rank, de-duplicate and pick the top `max_results` results.
+
+    Results whose normalized URL was already selected, or whose snippet is a
+    near duplicate of a selected one, are dropped. When `max_chars` is given,
+    results that would push the selection past it are skipped. Pass
+    ``rank=False`` for results that are already in ranked order.
+    """
+    selected: List[SearchResult] = []
+    seen_urls = set()
+    seen_snippets: List[FrozenSet[str]] = []
+    used = 0
+
+    if rank:
+        candidates = _ranked_candidates(
+            results, query, max_results * CANDIDATE_POOL_FACTOR)
+    else:
+        candidates = iter(results)
+
+    for result in candidates:
+        if len(selected) >= max_results:
+            break
+
+        url = normalize_url(result.url)
+        if url and url in seen_urls:
+            continue
+
+        words = _words(result.snippet)
+        if any(_similarity(words, seen) >= NEAR_DUPLICATE_THRESHOLD
+               for seen in seen_snippets):
+            continue
+
+        size = result_size(result)
+        if max_chars is not None and used + size > max_chars:
+            continue
+
+        selected.append(result)
+        if url:
+            seen_urls.add(url)
+        seen_snippets.append(words)
+        used += size
+
+    return selected
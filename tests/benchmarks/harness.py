@@ -0,0 +1,138 @@
+import contextlib
+import json
+import os
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+BASELINE_FILE = Path(__file__).with_name("baselines.json")
+PAYLOAD_DIR = Path(__file__).with_name("payloads")
+
+# Benchmarks are opt-in so coverage runs and CI don't trip on noisy timings
+ENABLED = (os.environ.get("RUN_BENCHMARKS") == "1"
+           or os.environ.get("BENCH_UPDATE") == "1")
+UPDATE = os.environ.get("BENCH_UPDATE") == "1"
+
+# Allowed regression as a fraction of the baseline (0.25 = 25% worse)
+THROUGHPUT_THRESHOLD = float(os.environ.get("BENCH_THRESHOLD", "0.25"))
+ALLOC_THRESHOLD = float(os.environ.get("BENCH_ALLOC_THRESHOLD",
+                                       str(THROUGHPUT_THRESHOLD)))
+
+requires_benchmarks = pytest.mark.skipif(
+    not ENABLED, reason="set RUN_BENCHMARKS=1 (or pipenv run bench)")
+
+
+def run_sync(coro):
+    """Drive a coroutine that never suspends, without an event loop."""
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coro.close()
+    raise RuntimeError("Benchmarked coroutine tried to suspend")
+
+
+class _NullWriter:
+    """Stdout sink so activity prints don't dominate the timings."""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+def load_payload(name: str) -> bytes:
+    """Return a recorded DuckDuckGo payload as raw response bytes."""
+    return (PAYLOAD_DIR / name).read_bytes()
+
+
+def measure(fn, min_time: float = 0.2, repeat: int = 5) -> dict:
+    """Measure throughput (best of `repeat`) and peak allocations of fn.
+
+    Anything fn prints is discarded while it is being measured.
+    """
+    with contextlib.redirect_stdout(_NullWriter()):
+        return _measure(fn, min_time, repeat)
+
+
+def _measure(fn, min_time: float, repeat: int) -> dict:
+    # Calibrate the loop count so each timed run lasts at least min_time
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops *= 2
+
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "ops_per_sec": round(loops / best, 2),
+        "peak_alloc_bytes": peak,
+    }
+
+
+def _load_baselines() -> dict:
+    if not BASELINE_FILE.exists():
+        return {}
+    return json.loads(BASELINE_FILE.read_text())
+
+
+def _save_baseline(name: str, metrics: dict) -> None:
+    baselines = _load_baselines()
+    baselines[name] = metrics
+    BASELINE_FILE.write_text(
+        json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+
+
+def check_baseline(name: str, metrics: dict) -> None:
+    """Compare metrics against the stored baseline, or record them.
+
+    Higher is better for ``ops_per_sec``; every other metric (allocations,
+    payload sizes) is treated as lower-is-better.
+    """
+    print(f"⏱️  {name}: {metrics}")
+
+    if UPDATE:
+        _save_baseline(name, metrics)
+        return
+
+    baseline = _load_baselines().get(name)
+    if baseline is None:
+        pytest.skip(f"No baseline for {name}; run pipenv run bench-update")
+
+    failures = []
+    for metric, value in metrics.items():
+        expected = baseline.get(metric)
+        if expected is None:
+            continue
+        if metric == "ops_per_sec":
+            floor = expected * (1 - THROUGHPUT_THRESHOLD)
+            if value < floor:
+                failures.append(f"{metric} {value} < {floor:.2f} "
+                                f"(baseline {expected})")
+        else:
+            ceiling = expected * (1 + ALLOC_THRESHOLD)
+            if value > ceiling:
+                failures.append(f"{metric} {value} > {ceiling:.0f} "
+                                f"(baseline {expected})")
+
+    assert not failures, f"{name} regressed: " + "; ".join(failures)
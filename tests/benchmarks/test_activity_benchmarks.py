@@ -0,0 +1,78 @@
+import json
+import pytest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))))
+
+from typing import List  # noqa: E402
+from activities import (summarize_results,  # noqa: E402
+                        parse_search_response)
+from data_converter import compact_data_converter  # noqa: E402
+from models import SearchResult, SummarizeInput  # noqa: E402
+from tests.benchmarks.harness import (requires_benchmarks,  # noqa: E402
+                                      run_sync, load_payload, measure,
+                                      check_baseline)
+
+pytestmark = requires_benchmarks
+
+
+def make_results(count: int) -> List[SearchResult]:
+    """Build `count` search results shaped like web_search output."""
+    return [
+        SearchResult(
+            title=f"Result {i} about Temporal workflows...",
+            url=f"https://example.com/articles/{i}",
+            snippet=(f"Snippet {i}: Temporal workflows orchestrate "
+                     f"activities with durable execution and retries."),
+            source="DuckDuckGo Related",
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("count", [1, 10, 100, 1000, 10000])
+def test_bench_summarize_results(count):
+    """Throughput of summarize_results across result list sizes."""
+    input = SummarizeInput("temporal workflows", make_results(count))
+
+    metrics = measure(lambda: run_sync(summarize_results(input)))
+
+    check_baseline(f"summarize_results[{count}]", metrics)
+
+
+@pytest.mark.parametrize("payload", ["duckduckgo_python.json",
+                                     "duckduckgo_empty.json"])
+def test_bench_web_search_parsing(payload):
+    """Decoding and parsing a recorded DuckDuckGo response body."""
+    raw = load_payload(payload)
+
+    metrics = measure(
+        lambda: parse_search_response(json.loads(raw), "python"))
+
+    check_baseline(f"web_search_parse[{payload}]", metrics)
+
+
+@pytest.mark.parametrize("value,type_hint", [
+    ("python programming", str),
+    (make_results(10), List[SearchResult]),
+    (SummarizeInput("python programming", make_results(10)), SummarizeInput),
+    (SummarizeInput("python programming", make_results(1000)),
+     SummarizeInput),
+], ids=["web_search_input", "web_search_output[10]",
+        "summarize_input[10]", "summarize_input[1000]"])
+def test_bench_serialization_round_trip(request, value, type_hint):
+    """Round trip activity inputs/outputs through the data converter."""
+    converter = compact_data_converter.payload_converter
+
+    def round_trip():
+        payloads = converter.to_payloads([value])
+        return converter.from_payloads(payloads, [type_hint])
+
+    metrics = measure(round_trip)
+    payload = converter.to_payloads([value])[0]
+    metrics["payload_bytes"] = payload.ByteSize()
+
+    check_baseline(f"round_trip[{request.node.callspec.id}]", metrics)
@@ -0,0 +1,91 @@
+import statistics
+import time
+import pytest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))))
+
+from temporalio import activity  # noqa: E402
+from temporalio.testing import WorkflowEnvironment  # noqa: E402
+from temporalio.worker import Worker  # noqa: E402
+from typing import List  # noqa: E402
+from data_converter import compact_data_converter  # noqa: E402
+from models import SearchResult, SummarizeInput  # noqa: E402
+from workflow import WebSearchAgentWorkflow  # noqa: E402
+from tests.benchmarks.harness import requires_benchmarks  # noqa: E402
+
+pytestmark = requires_benchmarks
+
+RUNS = 20
+
+
+# Instant stand-ins so only Temporal round trips are measured
+@activity.defn(name="web_search")
+async def instant_web_search(query: str) -> List[SearchResult]:
+    return [SearchResult(f"Result for {query}", "https://example.com",
+                         "Snippet", "Test Source")]
+
+
+@activity.defn(name="summarize_results")
+async def instant_summarize_results(input: SummarizeInput) -> str:
+    return f"Summary for {input.query}"
+
+
+async def median_latency(client, task_queue: str, eager: bool) -> float:
+    """Median seconds to run WebSearchAgentWorkflow end to end."""
+    latencies = []
+    for i in range(RUNS + 1):
+        start = time.perf_counter()
+        handle = await client.start_workflow(
+            WebSearchAgentWorkflow.run,
+            "latency probe",
+            id=f"latency-{task_queue}-{i}",
+            task_queue=task_queue,
+            request_eager_start=eager,
+        )
+        await handle.result()
+        latencies.append(time.perf_counter() - start)
+    # Drop the first run, which includes worker warm-up
+    return statistics.median(latencies[1:])
+
+
+@pytest.mark.asyncio
+async def test_in_process_eager_mode_latency():
+    """Report median latency with and without eager start and activities.
+
+    Round-trip timings against a dev server are too noisy to gate on, so the
+    medians are printed for comparison rather than asserted.
+    """
+    async with await WorkflowEnvironment.start_local(
+        data_converter=compact_data_converter,
+        dev_server_extra_args=[
+            "--dynamic-config-value",
+            "system.enableEagerWorkflowStart=true",
+            "--dynamic-config-value",
+            "system.enableActivityEagerExecution=true",
+        ],
+    ) as env:
+        client = env.client
+        activities = [instant_web_search, instant_summarize_results]
+
+        # Today's path: every task goes through a task queue poll
+        async with Worker(client, task_queue="separate-queue",
+                          workflows=[WebSearchAgentWorkflow],
+                          activities=activities,
+                          disable_eager_activity_execution=True):
+            separate = await median_latency(client, "separate-queue",
+                                            eager=False)
+
+        # In-process mode: eager workflow start and eager activities
+        async with Worker(client, task_queue="eager-queue",
+                          workflows=[WebSearchAgentWorkflow],
+                          activities=activities):
+            eager = await median_latency(client, "eager-queue", eager=True)
+
+    saved = separate - eager
+    print(f"⏱️  separate: {separate * 1000:.1f}ms, "
+          f"in-process eager: {eager * 1000:.1f}ms, "
+          f"saved {saved * 1000:.1f}ms ({saved / separate:.0%})")
@@ -12,6 +12,7 @@ from temporalio.testing import WorkflowEnvironment  # noqa: E402
 from temporalio.worker import Worker  # noqa: E402
 from workflow import WebSearchAgentWorkflow  # noqa: E402
 from activities import web_search, summarize_results  # noqa: E402
+from data_converter import compact_data_converter  # noqa: E402
 
 
 @pytest.mark.asyncio
@@ -19,7 +20,8 @@ async def test_web_search_workflow():
     """Test the web search workflow with a real
     search query using WorkflowEnvironment."""
     # Start an in-memory test environment
-    async with await WorkflowEnvironment.start_time_skipping() as env:
+    async with await WorkflowEnvironment.start_time_skipping(
+            data_converter=compact_data_converter) as env:
         client = env.client
 
         # Start a worker with our workflows + activities
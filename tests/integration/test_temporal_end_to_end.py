@@ -5,12 +5,14 @@ from temporalio.worker import Worker
 from workflow import HelloAgentWorkflow, WebSearchAgentWorkflow
 from activities import (simulate_llm_response, flaky_activity,
                         web_search, summarize_results)
+from data_converter import compact_data_converter
 
 
 @pytest.mark.asyncio
 async def test_workflow_end_to_end_with_retries():
     # Start an in-memory test environment
-    async with await WorkflowEnvironment.start_time_skipping() as env:
+    async with await WorkflowEnvironment.start_time_skipping(
+            data_converter=compact_data_converter) as env:
         client = env.client
 
         # Start a worker with our workflows + activities
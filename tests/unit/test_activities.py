@@ -1,13 +1,18 @@
+import dataclasses
 import pytest
 import sys
 import os
+from datetime import timedelta
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(
     os.path.dirname(os.path.abspath(__file__)))))
 
+from temporalio.testing import ActivityEnvironment  # noqa: E402
 from activities import (simulate_llm_response, web_search,  # noqa: E402
-                        summarize_results)
+                        summarize_results, parse_search_response,
+                        MAX_SEARCH_RESULTS, _http_timeout)
+from models import SearchResult, SummarizeInput  # noqa: E402
 
 
 @pytest.mark.asyncio
@@ -29,15 +34,11 @@ async def test_web_search():
 
     # Each result should have the required fields
     for result in results:
-        assert isinstance(result, dict)
-        assert "title" in result
-        assert "snippet" in result
-        assert "url" in result
-        assert "source" in result
-        assert isinstance(result["title"], str)
-        assert isinstance(result["snippet"], str)
-        assert isinstance(result["url"], str)
-        assert isinstance(result["source"], str)
+        assert isinstance(result, SearchResult)
+        assert isinstance(result.title, str)
+        assert isinstance(result.snippet, str)
+        assert isinstance(result.url, str)
+        assert isinstance(result.source, str)
 
 
 @pytest.mark.asyncio
@@ -50,27 +51,39 @@ async def test_web_search_with_empty_query():
     assert len(results) > 0
 
 
+def test_http_timeout_fits_inside_heartbeat_timeout():
+    """The HTTP request gives up well before the heartbeat timeout."""
+    heartbeat_timeout = timedelta(seconds=6)
+    env = ActivityEnvironment()
+    env.info = dataclasses.replace(env.info,
+                                   heartbeat_timeout=heartbeat_timeout)
+
+    connect, read = env.run(_http_timeout)
+
+    assert 0 < connect < read
+    assert connect + read < heartbeat_timeout.total_seconds()
+
+
 @pytest.mark.asyncio
 async def test_summarize_results():
     """Test the summarize_results activity with sample data."""
     query = "test query"
     search_results = [
-        {
-            "title": "Test Result 1",
-            "snippet": "This is a test snippet for the first result.",
-            "url": "https://example.com/1",
-            "source": "Test Source 1"
-        },
-        {
-            "title": "Test Result 2",
-            "snippet": "This is a test snippet for the second result.",
-            "url": "https://example.com/2",
-            "source": "Test Source 2"
-        }
+        SearchResult(
+            title="Test Result 1",
+            snippet="This is a test snippet for the first result.",
+            url="https://example.com/1",
+            source="Test Source 1",
+        ),
+        SearchResult(
+            title="Test Result 2",
+            snippet="This is a test snippet for the second result.",
+            url="https://example.com/2",
+            source="Test Source 2",
+        ),
     ]
 
-    args = (query, search_results)
-    summary = await summarize_results(args)
+    summary = await summarize_results(SummarizeInput(query, search_results))
 
     # Should return a string
     assert isinstance(summary, str)
@@ -103,10 +116,91 @@ async def test_summarize_results_empty():
     query = "test query"
     search_results = []
 
-    args = (query, search_results)
-    summary = await summarize_results(args)
+    summary = await summarize_results(SummarizeInput(query, search_results))
 
     # Should return error message for empty results
     assert isinstance(summary, str)
     assert "No results found" in summary
     assert query in summary
+
+
+@pytest.mark.asyncio
+async def test_summarize_results_dedupes_and_limits():
+    """Duplicates are dropped and only the top results are shown."""
+    query = "temporal"
+    search_results = [
+        SearchResult(f"Result {i}", f"https://example.com/{i}",
+                     f"Temporal snippet {i} " + "detail " * i, "Test Source")
+        for i in range(10)
+    ]
+    # Same page as the first result, with a different URL spelling
+    search_results.append(SearchResult(
+        "Duplicate", "https://www.example.com/0/", "Another description",
+        "Test Source"))
+
+    summary = await summarize_results(
+        SummarizeInput(query, search_results, max_results=3))
+
+    assert "Found 3 relevant results" in summary
+    assert "Result 2" in summary
+    assert "Result 3" not in summary
+    assert "Duplicate" not in summary
+    assert "8 duplicate or lower-ranked results not shown" in summary
+
+
+@pytest.mark.asyncio
+async def test_summarize_results_stays_within_budget():
+    """Summaries never grow past max_chars, however many results."""
+    search_results = [
+        SearchResult(f"Result {i}", f"https://example.com/{i}",
+                     f"Snippet {i} " + "x" * 2000, "Test Source")
+        for i in range(1000)
+    ]
+
+    summary = await summarize_results(
+        SummarizeInput("budget", search_results, max_results=1000,
+                       max_chars=2000))
+
+    assert len(summary) <= 2000
+    assert "**1. Result 0**" in summary
+    assert "---" in summary
+
+
+@pytest.mark.asyncio
+async def test_summarize_results_budget_below_fixed_overhead():
+    """A max_chars smaller than the header and footer is still honoured."""
+    search_results = [
+        SearchResult(f"Result {i}", f"https://example.com/{i}",
+                     f"Snippet {i}", "Test Source")
+        for i in range(3)
+    ]
+
+    summary = await summarize_results(
+        SummarizeInput("q", search_results, max_chars=150))
+
+    assert len(summary) <= 150
+    assert summary.startswith("🔍 **Search Results for: q**")
+
+    with pytest.raises(ValueError):
+        await summarize_results(
+            SummarizeInput("q", search_results, max_chars=0))
+
+
+def test_parse_search_response_flattens_and_bounds_topics():
+    """Grouped related topics are included and results are capped."""
+    topics = [{"Text": f"Topic {i} " + "filler " * i,
+               "FirstURL": f"https://duckduckgo.com/Topic_{i}"}
+              for i in range(20)]
+    data = {
+        "Heading": "Python",
+        "Abstract": "Python is a programming language.",
+        "AbstractURL": "https://en.wikipedia.org/wiki/Python",
+        "RelatedTopics": topics[:2] + [{"Name": "See also",
+                                        "Topics": topics[2:]}],
+    }
+
+    results = parse_search_response(data, "python")
+
+    assert len(results) == MAX_SEARCH_RESULTS
+    assert results[0].source == "DuckDuckGo Abstract"
+    assert len({result.url for result in results}) == len(results)
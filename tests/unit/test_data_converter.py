@@ -0,0 +1,76 @@
+import json
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))))
+
+from temporalio.converter import DataConverter  # noqa: E402
+from typing import List  # noqa: E402
+from data_converter import compact_data_converter  # noqa: E402
+from models import SearchResult, SummarizeInput  # noqa: E402
+
+converter = compact_data_converter.payload_converter
+
+RESULTS = [
+    SearchResult("Result 1", "https://example.com/1", "First snippet",
+                 "DuckDuckGo Abstract"),
+    SearchResult("Result 2", "https://example.com/2", "Second snippet",
+                 "DuckDuckGo Related"),
+]
+
+
+def round_trip(value, type_hint):
+    payloads = converter.to_payloads([value])
+    return converter.from_payloads(payloads, [type_hint])[0]
+
+
+def test_search_results_encode_positionally():
+    """Results go on the wire as rows, not dicts with repeated keys."""
+    [payload] = converter.to_payloads([RESULTS])
+
+    assert json.loads(payload.data) == [
+        ["Result 1", "https://example.com/1", "First snippet",
+         "DuckDuckGo Abstract"],
+        ["Result 2", "https://example.com/2", "Second snippet",
+         "DuckDuckGo Related"],
+    ]
+    assert round_trip(RESULTS, List[SearchResult]) == RESULTS
+
+
+def test_summarize_input_round_trip_is_smaller():
+    """SummarizeInput round trips and beats the default dict encoding."""
+    value = SummarizeInput("python", RESULTS)
+
+    assert round_trip(value, SummarizeInput) == value
+
+    [compact] = converter.to_payloads([value])
+    [default] = DataConverter.default.payload_converter.to_payloads([value])
+    assert len(compact.data) < len(default.data)
+
+
+def test_legacy_payloads_still_decode():
+    """History written before the typed models must still decode."""
+    legacy_results = [
+        {"title": "Result 1", "url": "https://example.com/1",
+         "snippet": "First snippet", "source": "DuckDuckGo Abstract"},
+        {"title": "Result 2", "url": "https://example.com/2",
+         "snippet": "Second snippet", "source": "DuckDuckGo Related"},
+    ]
+    default = DataConverter.default.payload_converter
+
+    # web_search used to return a list of dicts
+    payloads = default.to_payloads([legacy_results])
+    assert converter.from_payloads(
+        payloads, [List[SearchResult]]) == [RESULTS]
+
+    # summarize_results used to take a (query, search_results) tuple
+    payloads = default.to_payloads([("python", legacy_results)])
+    assert converter.from_payloads(
+        payloads, [SummarizeInput]) == [SummarizeInput("python", RESULTS)]
+
+    # and the default dataclass encoding (keyed dicts) decodes too
+    payloads = default.to_payloads([SummarizeInput("python", RESULTS)])
+    assert converter.from_payloads(
+        payloads, [SummarizeInput]) == [SummarizeInput("python", RESULTS)]
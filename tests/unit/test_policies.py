@@ -0,0 +1,93 @@
+import pytest
+import sys
+import os
+from datetime import timedelta
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))))
+
+from temporalio import workflow  # noqa: E402
+from temporalio.common import RetryPolicy  # noqa: E402
+from policies import (ACTIVITY_POLICIES, LatencyProfile,  # noqa: E402
+                      MAX_TIMEOUT, MIN_TIMEOUT, activity_options,
+                      build_policy, latency_from_timings)
+from profiling import ProfilingConfig, WorkerProfiler  # noqa: E402
+from workflow import HelloAgentWorkflow, WebSearchAgentWorkflow  # noqa: E402
+
+
+def test_timeouts_follow_latency_percentiles():
+    """Start-to-close and heartbeat scale with p99 and are clamped."""
+    retry = RetryPolicy(initial_interval=timedelta(seconds=1),
+                        maximum_attempts=2)
+
+    policy = build_policy("web_search", LatencyProfile(100, 2000), retry)
+    assert policy.start_to_close_timeout == timedelta(seconds=6)
+    assert policy.heartbeat_timeout == timedelta(seconds=4)
+    # Two attempts plus one backoff interval
+    assert policy.schedule_to_close_timeout == timedelta(seconds=13)
+
+    fast = build_policy("summarize_results", LatencyProfile(1, 2), retry)
+    assert fast.start_to_close_timeout == MIN_TIMEOUT
+    assert fast.heartbeat_timeout is None
+
+    slow = build_policy("summarize_results", LatencyProfile(1, 10 ** 6),
+                        retry)
+    assert slow.start_to_close_timeout == MAX_TIMEOUT
+
+
+def test_deterministic_errors_are_not_retried():
+    """flaky_activity's RuntimeError fails fast instead of retrying."""
+    flaky = ACTIVITY_POLICIES["flaky_activity"].retry_policy
+    assert "RuntimeError" in flaky.non_retryable_error_types
+
+    for policy in ACTIVITY_POLICIES.values():
+        assert "TypeError" in policy.retry_policy.non_retryable_error_types
+
+    assert "heartbeat_timeout" in activity_options("web_search")
+    assert "heartbeat_timeout" not in activity_options("summarize_results")
+
+
+def test_latency_from_profiler_timings(tmp_path):
+    """Percentiles are computed from the profiler's timings.jsonl."""
+    profiler = WorkerProfiler(ProfilingConfig(output_dir=tmp_path))
+    for wall_ms in range(1, 101):
+        profiler.record("activity", "web_search", wall_ms=wall_ms,
+                        loop_cpu_ms=0)
+    profiler.record("activity", "summarize_results", wall_ms=5,
+                    loop_cpu_ms=5)
+    profiler.record("loop_stall", "event_loop", lag_ms=500)
+    profiler.close()
+
+    latencies = latency_from_timings(str(tmp_path / "timings.jsonl"))
+
+    assert set(latencies) == {"web_search", "summarize_results"}
+    assert latencies["web_search"].p50_ms == pytest.approx(50.5)
+    assert latencies["web_search"].p99_ms == pytest.approx(99.0, abs=0.1)
+    assert latencies["summarize_results"] == LatencyProfile(5, 5)
+
+
+@pytest.mark.asyncio
+async def test_workflows_schedule_with_central_policies():
+    """Every activity call uses the options from policies.py."""
+    calls = {}
+    orig_execute_activity = workflow.execute_activity
+
+    async def mock_execute_activity(activity_name, *args, **kwargs):
+        kwargs.pop("result_type", None)
+        calls[activity_name] = kwargs
+        if activity_name == "web_search":
+            return []
+        return "done"
+
+    workflow.execute_activity = mock_execute_activity
+
+    try:
+        await WebSearchAgentWorkflow().run("policies")
+        await HelloAgentWorkflow().run("Neo")
+    finally:
+        workflow.execute_activity = orig_execute_activity
+
+    assert set(calls) == set(ACTIVITY_POLICIES)
+    for name, kwargs in calls.items():
+        assert kwargs == activity_options(name)
@@ -0,0 +1,176 @@
+import asyncio
+import dataclasses
+import json
+import pytest
+import sys
+import os
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))))
+
+from temporalio.testing import ActivityEnvironment  # noqa: E402
+from temporalio.worker import ExecuteActivityInput  # noqa: E402
+from profiling import ProfilingConfig, WorkerProfiler  # noqa: E402
+
+
+class FakeNextInbound:
+    """Stands in for the rest of the interceptor chain."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def init(self, outbound):
+        pass
+
+    async def execute_activity(self, input):
+        self.calls += 1
+        return "done"
+
+
+def read_timings(profiler):
+    profiler.flush()
+    with open(profiler.config.output_dir / "timings.jsonl") as f:
+        return [json.loads(line) for line in f]
+
+
+async def run_intercepted_activity(profiler, activity_type):
+    env = ActivityEnvironment()
+    env.info = dataclasses.replace(env.info, activity_type=activity_type)
+    next_inbound = FakeNextInbound()
+    inbound = profiler.intercept_activity(next_inbound)
+    input = ExecuteActivityInput(fn=lambda: None, args=[], executor=None,
+                                 headers={})
+    result = await env.run(inbound.execute_activity, input)
+    return result, next_inbound
+
+
+@pytest.mark.asyncio
+async def test_activity_timing_recorded_and_sampled(tmp_path):
+    """Enabled profiler records wall/CPU time and dumps sampled calls."""
+    profiler = WorkerProfiler(
+        ProfilingConfig(output_dir=tmp_path, sample_rate=1.0,
+                        capture_memory=True),
+        enabled=True,
+    )
+
+    result, next_inbound = await run_intercepted_activity(
+        profiler, "summarize_results")
+
+    assert result == "done"
+    assert next_inbound.calls == 1
+
+    [entry] = read_timings(profiler)
+    assert entry["kind"] == "activity"
+    assert entry["name"] == "summarize_results"
+    assert entry["profiled"] is True
+    assert entry["wall_ms"] >= 0
+    assert entry["loop_cpu_ms"] >= 0
+
+    assert len(list(tmp_path.glob("summarize_results-*.prof"))) == 1
+    assert len(list(tmp_path.glob("summarize_results-*.tracemalloc"))) == 1
+
+
+@pytest.mark.asyncio
+async def test_unsampled_activity_is_only_timed(tmp_path):
+    """Activities outside the sampled set are timed but never profiled."""
+    profiler = WorkerProfiler(
+        ProfilingConfig(output_dir=tmp_path, sample_rate=1.0),
+        enabled=True,
+    )
+
+    await run_intercepted_activity(profiler, "flaky_activity")
+
+    [entry] = read_timings(profiler)
+    assert entry["name"] == "flaky_activity"
+    assert entry["profiled"] is False
+    assert not list(tmp_path.glob("*.prof"))
+
+
+@pytest.mark.asyncio
+async def test_disabled_profiler_is_pass_through(tmp_path):
+    """Nothing is written until profiling is toggled on."""
+    profiler = WorkerProfiler(ProfilingConfig(output_dir=tmp_path))
+
+    result, next_inbound = await run_intercepted_activity(
+        profiler, "web_search")
+
+    assert result == "done"
+    assert next_inbound.calls == 1
+    profiler.flush()
+    assert not (tmp_path / "timings.jsonl").exists()
+
+    profiler.toggle()
+    await run_intercepted_activity(profiler, "web_search")
+    assert len(read_timings(profiler)) == 1
+
+
+def test_failed_write_does_not_stop_the_writer(tmp_path):
+    """A write that raises is logged and later records are still written."""
+    profiler = WorkerProfiler(ProfilingConfig(output_dir=tmp_path),
+                              enabled=True)
+
+    def failing_write(timings):
+        raise OSError("No space left on device")
+
+    profiler.submit_write(failing_write)
+    profiler.record("activity", "web_search", wall_ms=1)
+
+    [entry] = read_timings(profiler)
+    assert entry["name"] == "web_search"
+    profiler.close()
+
+
+def test_unwritable_output_dir_drops_writes(tmp_path):
+    """If the output directory can't be created, writes are dropped."""
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    profiler = WorkerProfiler(ProfilingConfig(output_dir=blocker / "out"),
+                              enabled=True)
+
+    profiler.record("activity", "web_search", wall_ms=1)
+    profiler.flush()
+    profiler.close()
+
+    assert not (blocker / "out").exists()
+
+
+def test_workflow_task_executor_times_activations(tmp_path):
+    """Work submitted to the workflow task executor is timed."""
+    profiler = WorkerProfiler(ProfilingConfig(output_dir=tmp_path),
+                              enabled=True)
+    executor = profiler.workflow_task_executor(max_workers=1)
+
+    class FakeActivation:
+        run_id = "run-123"
+
+    try:
+        future = executor.submit(lambda act: act.run_id, FakeActivation())
+        assert future.result() == "run-123"
+    finally:
+        executor.shutdown()
+
+    [entry] = read_timings(profiler)
+    assert entry["kind"] == "workflow_task"
+    assert entry["run_id"] == "run-123"
+
+
+@pytest.mark.asyncio
+async def test_event_loop_stall_detected(tmp_path):
+    """Blocking the event loop past the threshold is recorded."""
+    profiler = WorkerProfiler(
+        ProfilingConfig(output_dir=tmp_path, stall_threshold_ms=50),
+        enabled=True,
+    )
+    profiler.start()
+    try:
+        await asyncio.sleep(0.06)
+        time.sleep(0.2)  # Block the loop like a synchronous HTTP call
+        await asyncio.sleep(0.06)
+    finally:
+        await profiler.stop()
+
+    stalls = [e for e in read_timings(profiler) if e["kind"] == "loop_stall"]
+    assert stalls
+    assert stalls[0]["lag_ms"] >= 50
@@ -0,0 +1,97 @@
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))))
+
+from models import SearchResult  # noqa: E402
+from ranking import (normalize_url, rank_results,  # noqa: E402
+                     select_results, result_size)
+
+
+def make_result(title, url, snippet, source="DuckDuckGo Related"):
+    return SearchResult(title=title, url=url, snippet=snippet, source=source)
+
+
+def test_normalize_url():
+    """Equivalent URLs normalize to the same key."""
+    assert (normalize_url("https://www.Example.com/page/?b=2&a=1#top")
+            == normalize_url("http://example.com/page?a=1&b=2"))
+    assert (normalize_url("https://example.com/page?utm_source=x")
+            == normalize_url("https://example.com/page"))
+    assert (normalize_url("https://example.com/a")
+            != normalize_url("https://example.com/b"))
+    assert normalize_url("") == ""
+
+
+def test_rank_results_prefers_source_and_query_terms():
+    """Abstracts rank first, then results mentioning the query."""
+    related = make_result("Other", "https://a.com", "Unrelated text")
+    matching = make_result("Temporal", "https://b.com",
+                           "Temporal workflows in Python")
+    abstract = make_result("Abstract", "https://c.com", "Python overview",
+                           source="DuckDuckGo Abstract")
+
+    ranked = rank_results([related, matching, abstract], "temporal python")
+
+    assert ranked == [abstract, matching, related]
+
+
+def test_select_results_removes_duplicates():
+    """Duplicate URLs and near-duplicate snippets are dropped."""
+    first = make_result("First", "https://example.com/page",
+                        "Temporal orchestrates durable workflows in Python")
+    same_url = make_result("Copy", "https://www.example.com/page/",
+                           "A completely different description")
+    same_snippet = make_result("Mirror", "https://mirror.com/page",
+                               "Temporal orchestrates durable workflows "
+                               "in Python")
+    distinct = make_result("Second", "https://example.com/other",
+                           "Activities run side effects with retries")
+
+    selected = select_results([first, same_url, same_snippet, distinct],
+                              "temporal", max_results=10)
+
+    assert selected == [first, distinct]
+
+
+def test_select_results_respects_top_k_and_budget():
+    """Selection stops at max_results and skips results over budget."""
+    results = [make_result(f"Result {i}", f"https://example.com/{i}",
+                           f"Snippet number {i} " + "word " * i)
+               for i in range(10)]
+
+    assert select_results(results, "", max_results=3) == results[:3]
+
+    budget = result_size(results[0]) + result_size(results[1])
+    selected = select_results(results, "", max_results=10,
+                              max_chars=budget)
+    assert selected == results[:2]
+
+
+def test_select_results_falls_back_past_candidate_pool():
+    """Large inputs match a full ranking even when duplicates fill the pool."""
+    duplicates = [make_result(f"Copy {i}", "https://example.com/same",
+                              f"Temporal copy {i}")
+                  for i in range(50)]
+    others = [make_result(f"Other {i}", f"https://other.com/{i}",
+                          f"Unrelated entry number {i} " + "word " * i)
+              for i in range(50)]
+    results = others[:25] + duplicates + others[25:]
+
+    selected = select_results(results, "temporal", max_results=3)
+
+    assert selected == [duplicates[0], others[0], others[1]]
+    assert select_results(results, "", max_results=3) == others[:3]
+
+
+def test_select_results_can_skip_ranking():
+    """Pre-ranked results keep their order and are still de-duplicated."""
+    first = make_result("First", "https://example.com/a", "Plain text")
+    best = make_result("Best", "https://example.com/b", "Temporal text",
+                       source="DuckDuckGo Abstract")
+    copy = make_result("Copy", "https://example.com/a/", "Other text")
+
+    assert select_results([first, best, copy], "temporal", max_results=5,
+                          rank=False) == [first, best]
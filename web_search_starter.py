@@ -1,11 +1,45 @@
+import argparse
 import asyncio
 import time
 from temporalio.client import Client
 
+from data_converter import compact_data_converter
+from worker import TASK_QUEUE, create_worker
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run a web search.")
+    parser.add_argument(
+        "--in-process", action="store_true",
+        help="Run a worker in this process and start the workflow eagerly")
+    return parser.parse_args(argv)
+
+
+async def run_search(client: Client, query: str,
+                     eager: bool = False) -> str:
+    """Execute WebSearchAgentWorkflow and return its summary.
+
+    With `eager`, the server is asked to hand the first workflow task
+    straight back to a worker in this process in the start response,
+    saving a round trip through the task queue. It falls back to a normal
+    start when no local worker (or server support) is available.
+    """
+    handle = await client.start_workflow(
+        "WebSearchAgentWorkflow",           # workflow to call
+        query,                              # search query
+        id=f"web-search-{time.time_ns()}",  # unique ID
+        task_queue=TASK_QUEUE,              # must match worker
+        request_eager_start=eager,
+    )
+    return await handle.result()
+
+
+async def main(argv=None):
+    args = parse_args(argv)
 
-async def main():
     # Connect to the Temporal server
-    client = await Client.connect("localhost:7233")
+    client = await Client.connect(
+        "localhost:7233", data_converter=compact_data_converter)
 
     # Get search query from user
     query = input("🔍 What would you like to search for? ").strip()
@@ -17,18 +51,23 @@ async def main():
     # Start the web search workflow
     try:
         print(f"🚀 Starting search for: {query}")
-        result = await client.execute_workflow(
-            "WebSearchAgentWorkflow",           # workflow to call
-            query,                              # search query
-            id=f"web-search-{int(time.time())}",  # unique ID
-            task_queue="agent-task-queue",      # must match worker
-        )
+        if args.in_process:
+            async with create_worker(client):
+                # Time the search only, not worker startup
+                start = time.perf_counter()
+                result = await run_search(client, query, eager=True)
+        else:
+            start = time.perf_counter()
+            result = await run_search(client, query)
+        elapsed = time.perf_counter() - start
 
         print("\n" + "="*60)
         print("📋 SEARCH RESULTS")
         print("="*60)
         print(result)
         print("="*60)
+        mode = "in-process" if args.in_process else "separate worker"
+        print(f"⏱️  Completed in {elapsed * 1000:.0f}ms ({mode})")
 
     except Exception as e:
         print(f"❌ Error: {e}")
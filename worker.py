@@ -1,23 +1,79 @@
+import argparse
 import asyncio
+from pathlib import Path
 from temporalio.worker import Worker
 from temporalio.client import Client
 
 from workflow import HelloAgentWorkflow, WebSearchAgentWorkflow
 from activities import (simulate_llm_response, flaky_activity,
                         web_search, summarize_results)
+from data_converter import compact_data_converter
+from profiling import ProfilingConfig, WorkerProfiler
 
+TASK_QUEUE = "agent-task-queue"
 
-async def main():
-    client = await Client.connect("localhost:7233")
 
-    worker = Worker(
+def create_worker(client: Client, **options) -> Worker:
+    """Build a worker for all agent workflows and activities."""
+    return Worker(
         client,
-        task_queue="agent-task-queue",
+        task_queue=TASK_QUEUE,
         workflows=[HelloAgentWorkflow, WebSearchAgentWorkflow],
         activities=[simulate_llm_response, flaky_activity,
                     web_search, summarize_results],
+        **options,
     )
-    await worker.run()
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the agent worker.")
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="Start with profiling enabled (SIGUSR1 toggles it at runtime)")
+    parser.add_argument(
+        "--profile-dir", type=Path, default=Path("profiles"),
+        help="Directory for timings.jsonl and profile dumps")
+    parser.add_argument(
+        "--profile-sample-rate", type=float, default=0.1,
+        help="Fraction of web_search/summarize_results calls to cProfile")
+    parser.add_argument(
+        "--profile-memory", action="store_true",
+        help="Also capture tracemalloc snapshots for sampled calls")
+    parser.add_argument(
+        "--stall-threshold-ms", type=float, default=100.0,
+        help="Report event loop stalls longer than this")
+    return parser.parse_args(argv)
+
+
+async def main(argv=None):
+    args = parse_args(argv)
+    client = await Client.connect(
+        "localhost:7233", data_converter=compact_data_converter)
+
+    profiler = WorkerProfiler(
+        ProfilingConfig(
+            output_dir=args.profile_dir,
+            sample_rate=args.profile_sample_rate,
+            capture_memory=args.profile_memory,
+            stall_threshold_ms=args.stall_threshold_ms,
+        ),
+        enabled=args.profile,
+    )
+    workflow_task_executor = profiler.workflow_task_executor()
+
+    worker = create_worker(
+        client,
+        interceptors=[profiler],
+        workflow_task_executor=workflow_task_executor,
+    )
+
+    profiler.install_signal_handler()
+    profiler.start()
+    try:
+        await worker.run()
+    finally:
+        await profiler.stop()
+        workflow_task_executor.shutdown()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -1,6 +1,9 @@
 from temporalio import workflow
-from temporalio.common import RetryPolicy
-from datetime import timedelta
+from typing import List
+
+with workflow.unsafe.imports_passed_through():
+    from models import SearchResult, SummarizeInput
+    from policies import activity_options
 
 
 @workflow.defn
@@ -15,11 +18,8 @@ class WebSearchAgentWorkflow:
             search_results = await workflow.execute_activity(
                 "web_search",
                 query,
-                schedule_to_close_timeout=timedelta(seconds=30),
-                retry_policy=RetryPolicy(
-                    initial_interval=timedelta(seconds=2),
-                    maximum_attempts=3,
-                ),
+                result_type=List[SearchResult],
+                **activity_options("web_search"),
             )
         except Exception as e:
             print(f"❌ Web search failed: {e}")
@@ -29,12 +29,8 @@ class WebSearchAgentWorkflow:
         try:
             summary = await workflow.execute_activity(
                 "summarize_results",
-                (query, search_results),
-                schedule_to_close_timeout=timedelta(seconds=30),
-                retry_policy=RetryPolicy(
-                    initial_interval=timedelta(seconds=1),
-                    maximum_attempts=2,
-                ),
+                SummarizeInput(query=query, results=search_results),
+                **activity_options("summarize_results"),
             )
             print(f"✅ Web search workflow completed for: {query}")
             return summary
@@ -49,26 +45,22 @@ class WebSearchAgentWorkflow:
 class HelloAgentWorkflow:
     @workflow.run
     async def run(self, name: str) -> str:
-        # First try the flaky activity (this will fail and retry)
+        # First try the flaky activity (its failure is non-retryable)
         try:
             await workflow.execute_activity(
                 "flaky_activity",
                 name,
-                schedule_to_close_timeout=timedelta(seconds=10),
-                retry_policy=RetryPolicy(
-                    initial_interval=timedelta(seconds=1),
-                    maximum_attempts=3,
-                ),
+                **activity_options("flaky_activity"),
             )
         except Exception as e:
-            # Flaky activity failed after retries, continue anyway
-            print(f"Flaky activity failed after retries: {e}")
+            # Flaky activity failed, continue anyway
+            print(f"Flaky activity failed: {e}")
             pass
 
         # Call the LLM response
         result = await workflow.execute_activity(
             "simulate_llm_response",
             name,
-            schedule_to_close_timeout=timedelta(seconds=10),
+            **activity_options("simulate_llm_response"),
         )
         return result